@@ -1,11 +1,7 @@
-import stactools.core
-
 from stactools.ephemeral.stac import create_collection, create_item
 
 __all__ = ['create_collection', 'create_item']
 
-stactools.core.use_fsspec()
-
 
 def register_plugin(registry):
     from stactools.ephemeral import commands
@@ -0,0 +1,6 @@
+import os
+
+# Validation fetches JSON schemas over the network, so the tests only run it
+# when STAC_FULL_VALIDATE is set to a true value (scripts/cibuild sets it)
+FULL_VALIDATE = os.environ.get("STAC_FULL_VALIDATE",
+                               "").lower() in ("1", "true", "yes")
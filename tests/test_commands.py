@@ -1,19 +1,29 @@
-import os.path
+import os
+import unittest
 from tempfile import TemporaryDirectory
 
 import pystac
+import stactools.core
 from stactools.testing import CliTestCase
 
 from stactools.ephemeral.commands import create_ephemeralcmd_command
+from tests import FULL_VALIDATE
 
 
 class CommandsTest(CliTestCase):
+    def setUp(self):
+        super().setUp()
+        # The stac CLI enables fsspec I/O, so the commands are tested with it
+        self.addCleanup(pystac.StacIO.set_default,
+                        type(pystac.StacIO.default()))
+        stactools.core.use_fsspec()
+
     def create_subcommand_functions(self):
         return [create_ephemeralcmd_command]
 
     def test_create_collection(self):
         with TemporaryDirectory() as tmp_dir:
-            # Run your custom create-collection command and validate
+            # Run your custom create-collection command
 
             # Example:
             destination = os.path.join(tmp_dir, "collection.json")
@@ -25,18 +35,15 @@ class CommandsTest(CliTestCase):
                              0,
                              msg="\n{}".format(result.output))
 
-            jsons = [p for p in os.listdir(tmp_dir) if p.endswith(".json")]
-            self.assertEqual(len(jsons), 1)
+            self.assertTrue(os.path.isfile(destination))
 
             collection = pystac.read_file(destination)
             self.assertEqual(collection.id, "my-collection-id")
             # self.assertEqual(item.other_attr...
 
-            collection.validate()
-
     def test_create_item(self):
         with TemporaryDirectory() as tmp_dir:
-            # Run your custom create-item command and validate
+            # Run your custom create-item command
 
             # Example:
             destination = os.path.join(tmp_dir, "item.json")
@@ -50,11 +57,30 @@ class CommandsTest(CliTestCase):
                              0,
                              msg="\n{}".format(result.output))
 
-            jsons = [p for p in os.listdir(tmp_dir) if p.endswith(".json")]
-            self.assertEqual(len(jsons), 1)
+            self.assertTrue(os.path.isfile(destination))
 
             item = pystac.read_file(destination)
             self.assertEqual(item.id, "my-item-id")
             # self.assertEqual(item.other_attr...
 
-            item.validate()
+    @unittest.skipUnless(FULL_VALIDATE, "set STAC_FULL_VALIDATE to validate")
+    def test_validate(self):
+        with TemporaryDirectory() as tmp_dir:
+            collection_path = os.path.join(tmp_dir, "collection.json")
+            item_path = os.path.join(tmp_dir, "item.json")
+            self._run_ok(["ephemeralcmd", "create-collection", collection_path])
+            self._run_ok([
+                "ephemeralcmd",
+                "create-item",
+                "/path/to/asset.tif",
+                item_path,
+            ])
+
+            pystac.read_file(collection_path).validate()
+            pystac.read_file(item_path).validate()
+
+    def _run_ok(self, cmd):
+        result = self.run_command(cmd)
+        self.assertEqual(result.exit_code,
+                         0,
+                         msg="\n{}".format(result.output))
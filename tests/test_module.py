@@ -1,3 +1,5 @@
+import subprocess
+import sys
 import unittest
 
 import stactools.ephemeral
@@ -6,3 +8,18 @@ import stactools.ephemeral
 class TestModule(unittest.TestCase):
     def test_version(self):
         self.assertIsNotNone(stactools.ephemeral.__version__)
+
+    def test_import_does_not_load_fsspec(self):
+        # Run in a fresh interpreter, since other tests import stactools.core
+        result = subprocess.run(
+            [
+                sys.executable, "-c",
+                "import sys, stactools.ephemeral; "
+                "assert 'fsspec' not in sys.modules; "
+                "assert 'stactools.core' not in sys.modules"
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            universal_newlines=True,
+        )
+        self.assertEqual(result.returncode, 0, msg="\n{}".format(result.stdout))
@@ -1,6 +1,7 @@
 import unittest
 
 from stactools.ephemeral import stac
+from tests import FULL_VALIDATE
 
 
 class StacTest(unittest.TestCase):
@@ -8,15 +9,11 @@ class StacTest(unittest.TestCase):
         # Write tests for each for the creation of a STAC Collection
         # Create the STAC Collection...
         collection = stac.create_collection()
-        collection.set_self_href("")
 
         # Check that it has some required attributes
         self.assertEqual(collection.id, "my-collection-id")
         # self.assertEqual(collection.other_attr...
 
-        # Validate
-        collection.validate()
-
     def test_create_item(self):
         # Write tests for each for the creation of STAC Items
         # Create the STAC Item...
@@ -26,5 +23,11 @@ class StacTest(unittest.TestCase):
         self.assertEqual(item.id, "my-item-id")
         # self.assertEqual(item.other_attr...
 
-        # Validate
+    @unittest.skipUnless(FULL_VALIDATE, "set STAC_FULL_VALIDATE to validate")
+    def test_validate(self):
+        collection = stac.create_collection()
+        collection.set_self_href("")
+        collection.validate()
+
+        item = stac.create_item("/path/to/asset.tif")
         item.validate()